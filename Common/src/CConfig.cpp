@@ -2778,6 +2778,10 @@ void CConfig::SetConfig_Options() {
    *  \n DESCRIPTION: Flag specifying whether to internally combine a multi-objective function or treat separately */
   addPythonOption("OPT_COMBINE_OBJECTIVE");
 
+  /*!\brief OPT_PARALLEL_EVAL
+   *  \n DESCRIPTION: Number of objective gradients evaluated concurrently by the python scripts */
+  addPythonOption("OPT_PARALLEL_EVAL");
+
   /* DESCRIPTION: Current value of the design variables */
   addPythonOption("DV_VALUE_NEW");
 
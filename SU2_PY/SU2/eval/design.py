@@ -29,7 +29,8 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import os, copy
+import os, sys, copy
+from concurrent.futures import ProcessPoolExecutor
 from .. import io as su2io
 from . import func as su2func
 from . import grad as su2grad
@@ -375,6 +376,13 @@ def obj_df(dvs, config, state=None):
     else:
         # Evaluate objectives one-by-one
         marker_monitored = config["MARKER_MONITORING"]
+
+        # Independent adjoint solutions may be run concurrently, the loop
+        # below then picks the gradients up through the redundancy check
+        n_proc = int(config.get("OPT_PARALLEL_EVAL", 1))
+        if n_proc > 1 and n_obj > 1:
+            obj_df_parallel(n_proc, grad_method, config, state)
+
         for i_obj, this_obj in enumerate(objectives):
             # For multiple objectives are evaluated one-by-one rather than combined
             # MARKER_MONITORING should be updated to only include the marker for i_obj
@@ -411,6 +419,64 @@ def obj_df(dvs, config, state=None):
 #: def obj_df()
 
 
+def obj_df_parallel(n_proc, grad_method, config, state):
+    """SU2.eval.obj_df_parallel(n_proc,grad_method,config,state)
+
+    Evaluates the adjoint gradients of the objectives concurrently,
+    one process per objective, with at most n_proc processes.
+    Each adjoint runs in its own ./ADJOINT_<func_name> folder, the
+    direct solution is evaluated beforehand since it is shared.
+
+    Assumptions:
+        Objectives are evaluated one-by-one (OPT_COMBINE_OBJECTIVE= NO).
+        Only aerodynamic objectives with an adjoint gradient method,
+        other gradients are left for the serial evaluation.
+        Updates state by reference.
+    """
+
+    if not grad_method in ["CONTINUOUS_ADJOINT", "DISCRETE_ADJOINT"]:
+        return
+
+    def_objs = config["OPT_OBJECTIVE"]
+    objectives = def_objs.keys()
+    marker_monitored = config["MARKER_MONITORING"]
+
+    jobs = []
+    for i_obj, this_obj in enumerate(objectives):
+        if not this_obj in su2io.historyOutFields:
+            continue
+        if su2io.historyOutFields[this_obj]["TYPE"] != "COEFFICIENT":
+            continue
+        if this_obj in state.GRADIENTS:
+            continue
+
+        # shared direct solution (includes redundancy checks)
+        su2func(this_obj, config, state)
+
+        konfig = copy.deepcopy(config)
+        konfig["MARKER_MONITORING"] = marker_monitored[i_obj]
+        jobs.append((this_obj, grad_method, konfig, copy.deepcopy(state)))
+
+    if len(jobs) < 2:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(n_proc, len(jobs))) as executor:
+        futures = [executor.submit(_obj_grad, *job) for job in jobs]
+        for future in futures:
+            state.update(future.result())
+
+
+#: def obj_df_parallel()
+
+
+def _obj_grad(func_name, grad_method, config, state):
+    """evaluates a gradient in a worker process, returns the updated state"""
+    su2grad(func_name, grad_method, config, state)
+    # workers are reused, push this job's console output before returning
+    sys.stdout.flush()
+    return state
+
+
 def con_ceq(dvs, config, state=None):
     """vals = SU2.eval.con_ceq(dvs,config,state=None)
 
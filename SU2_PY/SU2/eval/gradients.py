@@ -1068,8 +1068,13 @@ def geometry(func_name, config, state=None):
                 config.GEO_PARAM = func_name
                 config.GEO_MODE = "GRADIENT"
 
+                # function values come with the same run,
+                # BOTH is not a valid GEO_MODE for the SU2 binaries
+                konfig = copy.copy(config)
+                konfig.GEO_MODE = "BOTH"
+
                 # # RUN GEOMETRY SOLUTION # #
-                info = su2run.geometry(config)
+                info = su2run.geometry(konfig)
                 state.update(info)
 
                 # no files to push
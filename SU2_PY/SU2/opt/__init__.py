@@ -5,3 +5,4 @@ from .scipy_tools import scipy_slsqp as SLSQP
 from .scipy_tools import scipy_cg as CG
 from .scipy_tools import scipy_bfgs as BFGS
 from .scipy_tools import scipy_powell as POWELL
+from .scipy_tools import scipy_trust_constr as TRUST_CONSTR
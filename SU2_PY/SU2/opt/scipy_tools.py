@@ -31,8 +31,69 @@
 
 import sys
 
+from collections import OrderedDict
+from functools import partial
 from .. import eval as su2eval
-from numpy import array, zeros
+from numpy import asarray
+
+
+# -------------------------------------------------------------------
+#  Project Cache
+# -------------------------------------------------------------------
+
+
+class _ProjectCache(object):
+    """cache = _ProjectCache(project,size=4)
+
+    Wraps an SU2 project and memoizes its optimizer interface
+    (obj_f, obj_df, con_ceq, con_dceq, con_cieq, con_dcieq)
+    for the last few design vectors queried
+
+    Scipy probes the objective, gradient and constraints at the
+    same iterate several times, this avoids repeating the project
+    design lookup and evaluation for each probe.
+    All other attributes are forwarded to the project.
+
+    Inputs:
+        project - an SU2 project
+        size    - optional, number of design vectors to keep
+    """
+
+    _methods = ["obj_f", "obj_df", "con_ceq", "con_dceq", "con_cieq", "con_dcieq"]
+
+    def __init__(self, project, size=4):
+        self.__dict__["_project"] = project
+        self.__dict__["_size"] = size
+        self.__dict__["_cache"] = OrderedDict()
+
+        # bind the memoized methods once, they are looked up on every probe
+        for name in self._methods:
+            self.__dict__[name] = partial(self._eval, name)
+
+    def __getattr__(self, name):
+        return getattr(self._project, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._project, name, value)
+
+    def _eval(self, name, x):
+        """evaluates project.<name>(x), checking for cached values"""
+
+        key = asarray(x, dtype=float).tobytes()
+        cache = self._cache
+
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = {}
+            if len(cache) > self._size:
+                cache.popitem(last=False)
+        vals = cache[key]
+
+        if not name in vals:
+            vals[name] = getattr(self._project, name)(x)
+
+        return vals[name]
 
 
 # -------------------------------------------------------------------
@@ -124,6 +185,9 @@ def scipy_slsqp(project, x0=None, xb=None, its=100, accu=1e-10, grads=True):
         "Lower and upper bound for each independent variable: " + str(xb) + "\n\n"
     )
 
+    # memoize project evaluations
+    project = _ProjectCache(project)
+
     # Run Optimizer
     outputs = fmin_slsqp(
         x0=x0,
@@ -217,6 +281,9 @@ def scipy_cg(project, x0=None, xb=None, its=100, accu=1e-10, grads=True):
         "Lower and upper bound for each independent variable: " + str(xb) + "\n\n"
     )
 
+    # memoize project evaluations
+    project = _ProjectCache(project)
+
     # Evaluate the objective function (only 1st iteration)
     obj_f(x0, project)
 
@@ -309,6 +376,9 @@ def scipy_bfgs(project, x0=None, xb=None, its=100, accu=1e-10, grads=True):
         "Lower and upper bound for each independent variable: " + str(xb) + "\n\n"
     )
 
+    # memoize project evaluations
+    project = _ProjectCache(project)
+
     # Evaluate the objective function (only 1st iteration)
     obj_f(x0, project)
 
@@ -384,6 +454,9 @@ def scipy_powell(project, x0=None, xb=None, its=100, accu=1e-10, grads=False):
     sys.stdout.write("Maximum number of iterations: " + str(its) + "\n")
     sys.stdout.write("Requested accuracy: " + str(accu) + "\n")
 
+    # memoize project evaluations
+    project = _ProjectCache(project)
+
     # Evaluate the objective function (only 1st iteration)
     obj_f(x0, project)
 
@@ -403,6 +476,169 @@ def scipy_powell(project, x0=None, xb=None, its=100, accu=1e-10, grads=False):
     return outputs
 
 
+# -------------------------------------------------------------------
+#  Scipy Trust-Region Constrained
+# -------------------------------------------------------------------
+
+
+def scipy_trust_constr(
+    project,
+    x0=None,
+    xb=None,
+    its=100,
+    accu=1e-10,
+    grads=True,
+    quasi_newton=True,
+    hvp=None,
+):
+    """result = scipy_trust_constr(project,x0=[],xb=[],its=100,accu=1e-10,quasi_newton=True,hvp=None)
+
+    Runs the Scipy implementation of the trust-region
+    constrained algorithm (trust-constr) with an SU2 project
+
+    SU2 provides no second derivatives, the Hessian of the
+    objective is approximated with BFGS updates, or replaced by
+    the identity (see unit_hessian) if quasi_newton is False.
+    Alternatively a Hessian-vector product can be provided.
+    The trust-region subproblems are solved with (projected) conjugate
+    gradients, i.e. only Hessian-vector products are required.
+
+    Inputs:
+        project      - an SU2 project
+        x0           - optional, initial guess
+        xb           - optional, design variable bounds
+        its          - max outer iterations, default 100
+        accu         - accuracy, default 1e-10
+        quasi_newton - optional, BFGS (True) or unit (False) Hessian
+        hvp          - optional, Hessian-vector product hvp(x,p,project),
+                       replaces the Hessian approximation
+
+    Outputs:
+       result - the outputs from scipy.optimize.minimize
+    """
+
+    # import scipy optimizer
+    from scipy.optimize import minimize, NonlinearConstraint, BFGS
+
+    # hessian handle
+    if hvp is not None:
+        fprime2 = None
+    elif quasi_newton:
+        fprime2 = BFGS()
+    else:
+        fprime2 = unit_hessian
+
+    # handle input cases
+    if x0 is None:
+        x0 = []
+    if xb is None:
+        xb = []
+
+    # gradient handles
+    if project.config.get("GRADIENT_METHOD", "NONE") == "NONE":
+        fprime = "2-point"
+        fprime_eqcons = "2-point"
+        fprime_ieqcons = "2-point"
+    else:
+        fprime = obj_df
+        fprime_eqcons = lambda x: con_dceq(x, project)
+        fprime_ieqcons = lambda x: con_dcieq(x, project)
+
+    # number of design variables
+    dv_size = project.config["DEFINITION_DV"]["SIZE"]
+    n_dv = sum(dv_size)
+    project.n_dv = n_dv
+
+    # Initial guess
+    if not x0:
+        x0 = [0.0] * n_dv
+
+    # prescale x0
+    dv_scales = project.config["DEFINITION_DV"]["SCALE"]
+    k = 0
+    for i, dv_scl in enumerate(dv_scales):
+        for j in range(dv_size[i]):
+            x0[k] = x0[k] / dv_scl
+            k = k + 1
+
+    # scale accuracy
+    obj = project.config["OPT_OBJECTIVE"]
+    obj_scale = []
+    for this_obj in obj.keys():
+        obj_scale = obj_scale + [obj[this_obj]["SCALE"]]
+
+    # Only scale the accuracy for single-objective problems:
+    if len(obj.keys()) == 1:
+        accu = accu * obj_scale[0]
+
+    # finite difference step, if gradients are not available
+    eps = 1.0e-04
+
+    # memoize project evaluations, shared by objective and constraints
+    project = _ProjectCache(project)
+
+    # constraints, scipy convention ceq(x) = 0.0 and cieq(x) > 0.0
+    cons = []
+    if project.config["OPT_CONSTRAINT"]["EQUALITY"]:
+        cons.append(
+            NonlinearConstraint(
+                lambda x: con_ceq(x, project),
+                0.0,
+                0.0,
+                jac=fprime_eqcons,
+                finite_diff_rel_step=eps,
+            )
+        )
+    if project.config["OPT_CONSTRAINT"]["INEQUALITY"]:
+        cons.append(
+            NonlinearConstraint(
+                lambda x: con_cieq(x, project),
+                0.0,
+                float("inf"),
+                jac=fprime_ieqcons,
+                finite_diff_rel_step=eps,
+            )
+        )
+
+    # optimizer summary
+    sys.stdout.write("Trust-region constrained (trust-constr) parameters:\n")
+    sys.stdout.write(
+        "Number of design variables: " + str(len(dv_size)) + " ( " + str(n_dv) + " ) \n"
+    )
+    sys.stdout.write("Objective function scaling factor: " + str(obj_scale) + "\n")
+    sys.stdout.write("Maximum number of iterations: " + str(its) + "\n")
+    sys.stdout.write("Requested accuracy: " + str(accu) + "\n")
+    sys.stdout.write("Initial guess for the independent variable(s): " + str(x0) + "\n")
+    sys.stdout.write(
+        "Lower and upper bound for each independent variable: " + str(xb) + "\n\n"
+    )
+
+    # Evaluate the objective function (only 1st iteration)
+    obj_f(x0, project)
+
+    # Run Optimizer
+    outputs = minimize(
+        fun=obj_f,
+        x0=x0,
+        args=(project,),
+        method="trust-constr",
+        jac=fprime,
+        hess=fprime2,
+        hessp=hvp,
+        bounds=xb or None,
+        constraints=cons,
+        options={
+            "maxiter": its,
+            "gtol": accu,
+            "finite_diff_rel_step": eps,
+            "verbose": 2,
+        },
+    )
+
+    # Done
+    return outputs
+
+
 def obj_f(x, project):
     """obj = obj_f(x,project)
 
@@ -414,9 +650,7 @@ def obj_f(x, project):
     """
 
     obj_list = project.obj_f(x)
-    obj = 0
-    for this_obj in obj_list:
-        obj = obj + this_obj
+    obj = float(sum(obj_list))
 
     return obj
 
@@ -432,18 +666,29 @@ def obj_df(x, project):
     """
 
     dobj_list = project.obj_df(x)
-    dobj = [0.0] * len(dobj_list[0])
-
-    for this_dobj in dobj_list:
-        idv = 0
-        for this_dv_dobj in this_dobj:
-            dobj[idv] = dobj[idv] + this_dv_dobj
-            idv += 1
-    dobj = array(dobj)
+    dobj = asarray(dobj_list, dtype=float).sum(axis=0)
 
     return dobj
 
 
+def unit_hessian(x, project):
+    """H = unit_hessian(x,project)
+
+    Unit Objective Function Hessian
+    SU2 Project interface to scipy trust-constr
+
+    scipy_trust_constr: H(x), LinearOperator[dim x dim]
+    only the action H*p = p is defined, no matrix is stored
+    """
+
+    from scipy.sparse.linalg import LinearOperator
+
+    dim = project.n_dv
+    identity = lambda p: p
+
+    return LinearOperator((dim, dim), matvec=identity, rmatvec=identity, dtype=float)
+
+
 def con_ceq(x, project):
     """cons = con_ceq(x,project)
 
@@ -454,12 +699,7 @@ def con_ceq(x, project):
     scipy_slsqp: ceq(x) = 0.0, ndarray[nceq]
     """
 
-    cons = project.con_ceq(x)
-
-    if cons:
-        cons = array(cons)
-    else:
-        cons = zeros([0])
+    cons = asarray(project.con_ceq(x), dtype=float)
 
     return cons
 
@@ -477,10 +717,7 @@ def con_dceq(x, project):
     dcons = project.con_dceq(x)
 
     dim = project.n_dv
-    if dcons:
-        dcons = array(dcons)
-    else:
-        dcons = zeros([0, dim])
+    dcons = asarray(dcons, dtype=float).reshape(-1, dim)
 
     return dcons
 
@@ -495,12 +732,7 @@ def con_cieq(x, project):
     scipy_slsqp: cieq(x) > 0.0, ndarray[ncieq]
     """
 
-    cons = project.con_cieq(x)
-
-    if cons:
-        cons = array(cons)
-    else:
-        cons = zeros([0])
+    cons = asarray(project.con_cieq(x), dtype=float)
 
     return -cons
 
@@ -518,9 +750,6 @@ def con_dcieq(x, project):
     dcons = project.con_dcieq(x)
 
     dim = project.n_dv
-    if dcons:
-        dcons = array(dcons)
-    else:
-        dcons = zeros([0, dim])
+    dcons = asarray(dcons, dtype=float).reshape(-1, dim)
 
     return -dcons
@@ -29,7 +29,7 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
+import os, shutil, copy, tempfile, hashlib
 
 from .. import io as su2io
 from .interface import GEO as SU2_GEO
@@ -40,19 +40,24 @@ from ..util import ordered_bunch
 # ----------------------------------------------------------------------
 
 
-def geometry(config, step=1e-3):
-    """info = SU2.run.geometry(config)
+def geometry(config, step=1e-3, cache=None):
+    """info = SU2.run.geometry(config,step=1e-3,cache=None)
 
     Runs an geometry analysis with:
         SU2.run.decomp()
         SU2.run.GEO()
 
     Assumptions:
-        Performs both function and gradient analysis
+        Performs function analysis if config.GEO_MODE=FUNCTION,
+        gradient analysis if config.GEO_MODE=GRADIENT
+        and both with a single SU2_GEO run if config.GEO_MODE=BOTH
 
     Inputs:
         config - an SU2 configuration
-        step   - gradient finite difference step if config.GEO_MODE=GRADIENT
+        step   - gradient finite difference step if config.GEO_MODE=GRADIENT or BOTH,
+                 a float or a step vector (list or numpy array)
+        cache  - optional, folder where SU2_GEO outputs are stored and
+                 reused by later runs with the same config and mesh file
 
     Outputs:
         info - SU2 State with keys:
@@ -65,8 +70,9 @@ def geometry(config, step=1e-3):
         ./
     """
 
-    # local copy
-    konfig = copy.deepcopy(config)
+    # local copy, only DV_PARAM is modified in place by unpack_dvs()
+    konfig = copy.copy(config)
+    konfig["DV_PARAM"] = copy.copy(config["DV_PARAM"])
 
     # unpack
     function_name = konfig["GEO_PARAM"]
@@ -81,9 +87,11 @@ def geometry(config, step=1e-3):
         func_filename = func_filename.split(".")[0] + ".dat"
         grad_filename = grad_filename.split(".")[0] + ".dat"
 
-    # choose dv values
+    # choose dv values, as lists since they are written to the config
     Definition_DV = konfig["DEFINITION_DV"]
     n_DV = len(Definition_DV["KIND"])
+    if hasattr(step, "tolist"):
+        step = step.tolist()  # numpy array or scalar, converted once
     if isinstance(step, list):
         assert len(step) == n_DV, "unexpected step vector length"
     else:
@@ -94,22 +102,64 @@ def geometry(config, step=1e-3):
     dv_new = step
     konfig.unpack_dvs(dv_new, dv_old)
 
-    # Run Solution
-    SU2_GEO(konfig)
+    # SU2_GEO always writes the function values, GRADIENT adds the gradients
+    geo_mode = konfig.GEO_MODE
+    if geo_mode == "BOTH":
+        konfig.GEO_MODE = "GRADIENT"
+
+    # outputs of this run
+    filenames = [func_filename]
+    if konfig.GEO_MODE == "GRADIENT":
+        filenames.append(grad_filename)
+
+    # cached outputs of an identical run
+    if cache:
+        cache = os.path.join(cache, "geo_" + _geometry_key(konfig))
+    if cache and all(os.path.exists(os.path.join(cache, f)) for f in filenames):
+        for f in filenames:
+            shutil.copy(os.path.join(cache, f), f)
+
+    else:
+        # Run Solution
+        SU2_GEO(konfig)
+
+        # store outputs, files are replaced atomically for concurrent runs
+        if cache:
+            os.makedirs(cache, exist_ok=True)
+            for f in filenames:
+                handle, temp = tempfile.mkstemp(dir=cache)
+                os.close(handle)
+                shutil.copy(f, temp)
+                os.replace(temp, os.path.join(cache, f))
 
     # info out
     info = su2io.State()
 
     # get function values
-    if konfig.GEO_MODE == "FUNCTION":
+    if geo_mode in ["FUNCTION", "BOTH"]:
         functions = su2io.tools.read_plot(func_filename)
-        for key, value in functions.items():
-            functions[key] = value[0]
-        info.FUNCTIONS.update(functions)
+        info.FUNCTIONS.update((key, value[0]) for key, value in functions.items())
 
     # get gradient_values
-    if konfig.GEO_MODE == "GRADIENT":
+    if geo_mode in ["GRADIENT", "BOTH"]:
         gradients = su2io.tools.read_plot(grad_filename)
         info.GRADIENTS.update(gradients)
 
     return info
+
+
+def _geometry_key(config):
+    """hash identifying an SU2_GEO run, from all config parameters
+    and the path, size and modification time of the mesh file
+
+    DV_VALUE_OLD/DV_VALUE_NEW only hold the finite difference steps,
+    different designs are told apart by the mesh file alone
+    """
+
+    name = config["MESH_FILENAME"]
+    mesh = os.stat(name)
+    data = repr(list(config.items()))
+    data += repr((os.path.realpath(name), mesh.st_size, mesh.st_mtime_ns))
+
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
@@ -71,7 +71,7 @@ def main():
         "--optimization",
         dest="optimization",
         default="SLSQP",
-        help="OPTIMIZATION techique (SLSQP, CG, BFGS, POWELL)",
+        help="OPTIMIZATION techique (SLSQP, CG, BFGS, POWELL, TRUST_CONSTR)",
         metavar="OPTIMIZATION",
     )
     parser.add_option(
@@ -286,6 +286,8 @@ def shape_optimization(
         SU2.opt.BFGS(project, x0, xb, its, accu)
     if optimization == "POWELL":
         SU2.opt.POWELL(project, x0, xb, its, accu)
+    if optimization == "TRUST_CONSTR":
+        SU2.opt.TRUST_CONSTR(project, x0, xb, its, accu)
 
     # rename project file
     if projectname:
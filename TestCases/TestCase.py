@@ -25,10 +25,11 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with SU2. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import print_function, division, absolute_import
-import time, os, subprocess, datetime, sys
+import time, os, subprocess, datetime, sys, signal
 import difflib
 import platform
 import argparse
+import multiprocessing
 
 
 def print_vals(vals, name="Values"):
@@ -42,11 +43,45 @@ def is_float(test_string):
     except ValueError:
         return False
 
-def parse_args(description: str):
+def parse_args(description: str, jobs: bool = False):
     parser = argparse.ArgumentParser(description=description)
     parser.add_argument('--tsan', action='store_true', help='Run thread sanitizer tests. Requires a tsan-enabled SU2 build.')
+    if jobs: # only for scripts that dispatch their tests with run_tests()
+        parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of tests to run concurrently, 0 picks a value from the number of cores.')
     return parser.parse_args()
 
+def run_tests(test_list, running_with_tsan=False, jobs=1):
+    """Run test.run_test() for each test and return the list of results, in the order of test_list.
+
+    With jobs > 1 the tests are distributed over a pool of processes. Tests that share a
+    cfg_dir write to the same output files, they are run one after the other by the same worker.
+    Each test then runs in its own process group, so that a timeout only kills that test.
+    """
+    if jobs <= 1:
+        return [test.run_test(running_with_tsan) for test in test_list]
+    if not test_list:
+        return []
+
+    groups = {}
+    for i, test in enumerate(test_list):
+        groups.setdefault(test.cfg_dir, []).append(i)
+    groups = list(groups.values())
+
+    with multiprocessing.Pool(processes=min(jobs, len(groups))) as pool:
+        results = pool.starmap(run_test_group, [([test_list[i] for i in group], running_with_tsan) for group in groups])
+
+    pass_list = [False] * len(test_list)
+    for group, group_results in zip(groups, results):
+        for i, passed in zip(group, group_results):
+            pass_list[i] = passed
+    return pass_list
+
+def run_test_group(tests, running_with_tsan=False):
+    """Run a list of tests sequentially, used by run_tests() in the worker processes."""
+    passed = [test.run_test(running_with_tsan, own_session=True) for test in tests]
+    sys.stdout.flush()
+    return passed
+
 class TestCase:
 
     class Command:
@@ -125,7 +160,7 @@ class TestCase:
         self.reference_file_aarch64 = ""
         self.test_file      = "of_grad.dat"
 
-    def run_test(self, running_with_tsan=False):
+    def run_test(self, running_with_tsan=False, own_session=False):
 
         if not self.is_enabled(running_with_tsan):
             return True
@@ -167,7 +202,7 @@ class TestCase:
         os.chdir(self.cfg_dir)
         print(os.getcwd())
         start   = datetime.datetime.now()
-        process = subprocess.Popen(shell_command, shell=True)  # This line launches SU2
+        process = subprocess.Popen(shell_command, shell=True, start_new_session=own_session)  # This line launches SU2
 
         # check for timeout
         while process.poll() is None:
@@ -176,10 +211,16 @@ class TestCase:
             running_time = (now - start).seconds
             if running_time > self.timeout:
                 try:
-                    process.kill()
-                    self.command.killall() # In case of parallel execution
+                    if own_session:
+                        # only kill the processes of this test, other tests may be running concurrently
+                        os.killpg(process.pid, signal.SIGKILL)
+                    else:
+                        process.kill()
+                        self.command.killall() # In case of parallel execution
                 except AttributeError: # popen.kill apparently fails on some versions of subprocess... the killall command should take care of things!
                     pass
+                except ProcessLookupError: # the test finished in the meantime
+                    pass
                 timed_out = True
                 passed    = False
 
@@ -28,16 +28,17 @@
 # make print(*args) function available in PY2.6+, does'nt work on PY < 2.6
 from __future__ import print_function
 
-import sys
+import sys, os
 from TestCase import TestCase
 from TestCase import parse_args
+from TestCase import run_tests
 
 def main():
     '''This program runs SU2 and ensures that the output matches specified values.
        This will be used to do checks when code is pushed to github
        to make sure nothing is broken. '''
 
-    args = parse_args('Hybrid Regression AD Tests')
+    args = parse_args('Hybrid Regression AD Tests', jobs=True)
 
     test_list = []
 
@@ -227,7 +228,10 @@ def main():
         test.tol = 1e-4
     #end
 
-    pass_list = [ test.run_test(args.tsan) for test in test_list ]
+    # each test uses 2 threads
+    jobs = args.jobs if args.jobs > 0 else max(1, os.cpu_count() // 2)
+
+    pass_list = run_tests(test_list, args.tsan, jobs)
 
     ###################################
     ### Python Wrapper              ###